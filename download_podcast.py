@@ -1,18 +1,31 @@
 import subprocess
 import sys
 import importlib.util
+import site
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import feedparser
 import re
 import os
 import json
+import html
 import hashlib
+import shutil
 import argparse
 import logging
 import time
 import unicodedata
-from functools import wraps
+import io
+import email.utils
+import xml.etree.ElementTree as ET
+import threading
+import contextlib
+import socket
+import itertools
+from functools import wraps, lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urljoin, urlparse
 from datetime import datetime
 
@@ -21,17 +34,79 @@ try:
 except ImportError:
     tqdm = None
 
+try:
+    from tqdm.contrib.logging import logging_redirect_tqdm
+except ImportError:
+    logging_redirect_tqdm = None
+
 try:
     import dateutil.parser
 except ImportError:
     dateutil = None
 
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser  # selectolax releases without the Lexbor backend
+    except ImportError:
+        HTMLParser = None
+
+try:
+    import lxml
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+FEED_CACHE_FILE = 'feed_cache.json'
+ITUNES_NS = '{http://www.itunes.com/dtds/podcast-1.0.dtd}'
+MODULE_CHECK_CACHE = os.path.join(os.path.expanduser('~'), '.cache', 'iono-fm-downloader', 'modules.json')
+CHUNK_SIZE = 1 << 20  # 1 MiB read/write size for downloads and hashing
+
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\s\-\.]+')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+_EP_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    r'Episode\s+(\d+)', r'Ep\.?\s*(\d+)', r'#(\d+)', r'Part\s+(\d+)',
+    r'(\d+):00\s+nuus', r'S\d+E(\d+)', r'Season\s+\d+\s+Episode\s+(\d+)',
+    r'\b(\d{1,3})\b(?=\s*(?:-|–|:|$))', r'^(\d+)\b', r'\b(\d+)$'
+]]
+
+# Per-quality (STATE_FROM_SERVER JSON, bare URL) patterns for audio URLs in page scripts
+_QUALITY_RE = {
+    q: (
+        re.compile(rf'"url":"https://dl\.iono\.fm/epi/prov_\d+/epi_\d+_{q}\.m4a"'),
+        re.compile(rf'https://dl\.iono\.fm/epi/prov_\d+/epi_\d+_{q}\.m4a')
+    )
+    for q in ('high', 'medium', 'low')
+}
+_AUDIO_URL_RE = re.compile(r'https://dl\.iono\.fm/epi/prov_\d+/epi_\d+_\w+\.m4a')
+
+# Lightweight scan of <meta> tags and <title> so most pages never need a full parse tree
+_META_TAG_RE = re.compile(r'<meta\b((?:[^<>"\']|"[^"]*"|\'[^\']*\')*)>', re.IGNORECASE)
+_ATTR_RE = re.compile(r'([\w:.-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+))')
+_TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]+>')
+_PARSED_TAGS = ('meta', 'audio', 'script')
+_NEEDED_META_KEYS = (('property', 'og:title'), ('name', 'description'), ('name', 'author'))
+
+_EXT_RE = re.compile(r'\.(mp3|m4a)(?:[?#]|$)', re.IGNORECASE)
+_CONTENT_TYPE_EXTENSIONS = {
+    'audio/mpeg': '.mp3',
+    'audio/mp3': '.mp3',
+    'audio/mp4': '.m4a',
+    'audio/m4a': '.m4a',
+    'audio/x-m4a': '.m4a'
+}
+
 module_map = {
     'requests': 'requests',
     'beautifulsoup4': 'bs4',
     'feedparser': 'feedparser',
     'tqdm': 'tqdm',
-    'python-dateutil': 'dateutil'
+    'python-dateutil': 'dateutil',
+    'lxml': 'lxml',
+    'selectolax': 'selectolax'
 }
 
 def setup_logging(log_level='INFO'):
@@ -58,6 +133,34 @@ def setup_logging(log_level='INFO'):
 
 logger = setup_logging()
 
+def create_session():
+    """Create a shared HTTP session with keep-alive connection pooling."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=0)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['User-Agent'] = 'iono-fm-downloader (+https://github.com/dhdinfosec/iono-fm-downloader)'
+    return session
+
+SESSION = create_session()
+
+def prime_dns(hosts=('iono.fm', 'dl.iono.fm'), port=443):
+    """Resolve hosts in the background so the OS resolver cache is warm for the first requests."""
+    def resolve(host):
+        try:
+            socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except OSError as e:
+            logger.debug(f"DNS prefetch failed for {host}: {e}")
+    
+    for host in hosts:
+        threading.Thread(target=resolve, args=(host,), daemon=True).start()
+
+# Set on Ctrl-C so in-flight downloads in worker threads stop promptly
+CANCEL_EVENT = threading.Event()
+
+class DownloadCancelled(Exception):
+    """Raised inside a download worker once CANCEL_EVENT is set."""
+
 def retry_on_failure(max_retries=3, delay=1, backoff=2):
     """Retry decorator with exponential backoff."""
     def decorator(func):
@@ -88,7 +191,11 @@ def load_config():
         'preferred_quality': 'medium',
         'preferred_format': 'auto',
         'log_level': 'INFO',
-        'filename_max_length': 80
+        'filename_max_length': 80,
+        'max_concurrent_fetches': 10,
+        'max_concurrent_downloads': 6,
+        'verify_hash': False,
+        'prefer_rss_metadata': False
     }
     
     if os.path.exists(config_file):
@@ -101,12 +208,31 @@ def load_config():
     
     return default_config
 
+def module_check_key():
+    """Identify the interpreter and its installed packages for the cached module check."""
+    site_dirs = list(getattr(site, 'getsitepackages', lambda: [])()) + [site.getusersitepackages()]
+    mtime = max((os.path.getmtime(path) for path in site_dirs if os.path.isdir(path)), default=0)
+    return f"{sys.version}|{sys.prefix}|{mtime}"
+
 def install_missing_modules():
-    """Check and install required Python modules."""
+    """Check and install required Python modules, skipping the probe if nothing changed since the last check."""
+    try:
+        with open(MODULE_CHECK_CACHE, 'r') as f:
+            module_check = json.load(f)
+        if module_check.get('key') == module_check_key():
+            logger.debug("Installed modules unchanged since last check. Skipping module probe.")
+            for pip_name in module_check.get('missing_optional', []):
+                logger.warning(f"Optional module '{pip_name}' not found. Some features may be limited.")
+            return
+    except (json.JSONDecodeError, IOError, AttributeError):
+        pass
+    
+    missing_optional = []
     for pip_name, import_name in module_map.items():
         if importlib.util.find_spec(import_name) is None:
-            if pip_name in ['tqdm', 'python-dateutil']:
+            if pip_name in ['tqdm', 'python-dateutil', 'lxml', 'selectolax']:
                 logger.warning(f"Optional module '{pip_name}' not found. Some features may be limited.")
+                missing_optional.append(pip_name)
                 continue
             logger.info(f"Installing {pip_name}...")
             try:
@@ -115,6 +241,12 @@ def install_missing_modules():
             except subprocess.CalledProcessError:
                 logger.error(f"Failed to install {pip_name}. Install manually with 'pip install {pip_name}'.")
                 sys.exit(1)
+    
+    try:
+        os.makedirs(os.path.dirname(MODULE_CHECK_CACHE), exist_ok=True)
+        write_json_atomic(MODULE_CHECK_CACHE, {'key': module_check_key(), 'missing_optional': missing_optional})
+    except IOError as e:
+        logger.debug(f"Could not save module check cache: {e}")
 
 def parse_arguments():
     """Parse command-line arguments."""
@@ -127,6 +259,7 @@ def parse_arguments():
     parser.add_argument("--short-names", action="store_true", help="Use shorter og:title for filenames")
     parser.add_argument("--dir", help="Custom directory name for downloads (e.g., bbc)")
     parser.add_argument("--recheck", action="store_true", help="Force completeness check on all cached files")
+    parser.add_argument("--no-install-check", action="store_true", help="Skip the startup check for missing Python modules")
     parser.add_argument("--log-level", choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], 
                        default='INFO', help="Set logging level")
     args = parser.parse_args()
@@ -142,29 +275,24 @@ def sanitize_filename(name, max_length=80):
         return "unnamed"
     
     normalized = unicodedata.normalize('NFKC', str(name))
-    sanitized = re.sub(r'[^\w\s\-\.]', '', normalized)
-    sanitized = re.sub(r'\s+', '_', sanitized.strip()).lower()
+    sanitized = _WHITESPACE_RE.sub('_', _UNSAFE_FILENAME_RE.sub('', normalized).strip()).lower()
     return sanitized[:max_length].rstrip('_')
 
+@lru_cache(maxsize=4096)
 def extract_episode_number(text):
     """Enhanced episode number extraction."""
     if not text:
         return None
     
-    patterns = [
-        r'Episode\s+(\d+)', r'Ep\.?\s*(\d+)', r'#(\d+)', r'Part\s+(\d+)',
-        r'(\d+):00\s+nuus', r'S\d+E(\d+)', r'Season\s+\d+\s+Episode\s+(\d+)',
-        r'\b(\d{1,3})\b(?=\s*(?:-|–|:|$))', r'^(\d+)\b', r'\b(\d+)$'
-    ]
-    
-    for pattern in patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    for pattern in _EP_PATTERNS:
+        matches = pattern.findall(text)
         if matches:
             numbers = [int(match) for match in matches if match.isdigit() and 1 <= int(match) <= 9999]
             if numbers:
                 return numbers[0]
     return None
 
+@lru_cache(maxsize=4096)
 def parse_publication_date(pub_date_str):
     """Parse various date formats robustly."""
     if not pub_date_str:
@@ -178,10 +306,52 @@ def parse_publication_date(pub_date_str):
         logger.debug(f"Could not parse date: {pub_date_str}")
         return datetime.min
 
-def extract_episode_metadata(soup, rss_ep_num, rss_title):
+def find_elements(page_html, parsed):
+    """Return (attributes, text) pairs for each <meta>, <audio> and <script> tag, parsing the HTML into parsed at most once."""
+    if not parsed:
+        if HTMLParser:
+            tree = HTMLParser(page_html)
+            parsed.update({tag: [(node.attributes, node.text()) for node in tree.css(tag)] for tag in _PARSED_TAGS})
+        else:
+            soup = BeautifulSoup(page_html, HTML_PARSER)
+            parsed.update({tag: [(element.attrs, element.string or '') for element in soup.find_all(tag)] for tag in _PARSED_TAGS})
+    return parsed
+
+def extract_meta_tags(page_html, parsed):
+    """Collect <meta> content keyed by (attribute, value), e.g. ('property', 'og:title')."""
+    meta = {}
+    for tag in _META_TAG_RE.finditer(page_html):
+        attrs = {}
+        for match in _ATTR_RE.finditer(tag.group(1)):
+            value = next(v for v in match.group(2, 3, 4) if v is not None)
+            attrs.setdefault(match.group(1).lower(), html.unescape(value))
+        for key in ('property', 'name'):
+            if key in attrs:
+                meta.setdefault((key, attrs[key]), attrs.get('content'))
+    
+    if any(meta.get(key) is None for key in _NEEDED_META_KEYS):
+        logger.debug("Regex scan missed og:title, description or author; parsing full document")
+        for attrs, _ in find_elements(page_html, parsed)['meta']:
+            for key in ('property', 'name'):
+                if attrs.get(key) and meta.get((key, attrs[key])) is None:
+                    meta[(key, attrs[key])] = attrs.get('content')
+    return meta
+
+def publication_time_tuple(published_parsed, pub_date=''):
+    """Return a comparable 9-tuple for sorting, preferring feedparser's pre-parsed date."""
+    if published_parsed:
+        return tuple(published_parsed)[:9]
+    if pub_date:
+        return tuple(parse_publication_date(pub_date).utctimetuple())
+    return (0,) * 9
+
+def extract_episode_metadata(meta, page_html, rss_ep_num, rss_title):
     """Extract episode number, description, and og:title from HTML."""
-    page_title_tag = soup.find('meta', attrs={'property': 'og:title'})
-    page_title = page_title_tag.get('content', '') if page_title_tag else (soup.title.string.strip() if soup.title else '')
+    if ('property', 'og:title') in meta:
+        page_title = meta[('property', 'og:title')] or ''
+    else:
+        title_match = _TITLE_RE.search(page_html)
+        page_title = html.unescape(title_match.group(1)).strip() if title_match else ''
     
     html_ep_num = extract_episode_number(page_title)
     if html_ep_num is None:
@@ -190,18 +360,16 @@ def extract_episode_metadata(soup, rss_ep_num, rss_title):
     elif html_ep_num != rss_ep_num and rss_ep_num is not None:
         logger.debug(f"HTML episode number ({html_ep_num}) differs from RSS ({rss_ep_num}). Using HTML.")
 
-    meta_desc = soup.find('meta', attrs={'name': 'description'})
-    description = meta_desc.get('content') if meta_desc else page_title
+    description = meta[('name', 'description')] if ('name', 'description') in meta else page_title
 
     if page_title and page_title != rss_title:
         logger.debug(f"HTML title ('{page_title}') differs from RSS title ('{rss_title}')")
 
     return html_ep_num, description, page_title
 
-def extract_author(soup):
+def extract_author(meta):
     """Extract author from <meta name="author">."""
-    author_meta = soup.find('meta', attrs={'name': 'author'})
-    author = author_meta.get('content') if author_meta else None
+    author = meta.get(('name', 'author'))
     logger.debug(f"Extracted author: {author or 'None (will use podcast name)'}")
     return author
 
@@ -212,23 +380,33 @@ def get_file_extension(url, content_type=None, preferred_format='auto'):
         return f'.{preferred_format}'
     
     if content_type:
-        content_type_lower = content_type.lower()
-        logger.debug(f"Content-Type: {content_type_lower}")
-        if 'audio/mpeg' in content_type_lower or 'audio/mp3' in content_type_lower:
-            return '.mp3'
-        elif 'audio/mp4' in content_type_lower or 'audio/m4a' in content_type_lower:
-            return '.m4a'
-    
-    url_lower = url.lower()
-    logger.debug(f"URL for extension check: {url_lower}")
-    if '.mp3' in url_lower:
-        return '.mp3'
-    elif '.m4a' in url_lower:
-        return '.m4a'
+        mime_type = content_type.partition(';')[0].strip().lower()
+        logger.debug(f"Content-Type: {mime_type}")
+        if mime_type in _CONTENT_TYPE_EXTENSIONS:
+            return _CONTENT_TYPE_EXTENSIONS[mime_type]
+    
+    logger.debug(f"URL for extension check: {url}")
+    match = _EXT_RE.search(url)
+    if match:
+        return '.' + match.group(1).lower()
     
     logger.debug("Falling back to default extension: .m4a")
     return '.m4a'
 
+def resolve_extension(url, session, config):
+    """Determine file extension, probing Content-Type only when the URL is ambiguous."""
+    if config['preferred_format'] != 'auto' or _EXT_RE.search(url):
+        return get_file_extension(url, None, config['preferred_format'])
+    
+    content_type = None
+    try:
+        head_response = session.head(url, allow_redirects=True, timeout=config['timeout'])
+        content_type = head_response.headers.get('Content-Type', '')
+    except requests.RequestException:
+        logger.debug(f"Could not fetch Content-Type for {url}")
+    
+    return get_file_extension(url, content_type, config['preferred_format'])
+
 def get_quality_preference_order(preferred_quality):
     """Get quality preference order."""
     quality_orders = {
@@ -238,61 +416,78 @@ def get_quality_preference_order(preferred_quality):
     }
     return quality_orders.get(preferred_quality, quality_orders['medium'])
 
+def select_enclosure_url(rss_entry, quality_order):
+    """Pick the RSS enclosure URL that best matches the quality preference."""
+    enclosure_urls = []
+    for enclosure in rss_entry.get('enclosures', []):
+        url = enclosure.get('url', '')
+        if url and ('mp3' in url.lower() or 'm4a' in url.lower()):
+            enclosure_urls.append(url)
+    
+    for quality in quality_order:
+        for url in enclosure_urls:
+            if quality in url.lower():
+                logger.debug(f"Selected enclosure URL with quality {quality}: {url}")
+                return url
+    if enclosure_urls:
+        logger.debug(f"No preferred quality found, using first enclosure: {enclosure_urls[0]}")
+        return enclosure_urls[0]
+    return None
+
+def get_rss_metadata(rss_entry, rss_ep_num, config):
+    """Build episode metadata from the RSS entry when its enclosure has the preferred quality."""
+    audio_url = select_enclosure_url(rss_entry, get_quality_preference_order(config['preferred_quality']))
+    if not audio_url or config['preferred_quality'] not in audio_url.lower():
+        return None
+    
+    return (audio_url, *rss_episode_names(rss_entry, rss_ep_num), rss_entry.get('author'))
+
+def rss_episode_names(rss_entry, rss_ep_num):
+    """Return the episode number, description, and title used to name an episode from its RSS entry."""
+    title = rss_entry.get('title', '')
+    summary = html.unescape(_TAG_RE.sub('', rss_entry.get('summary', ''))).strip()
+    return rss_ep_num, summary or title, title
+
 @retry_on_failure(max_retries=3, delay=1, backoff=2)
-def extract_audio_url(soup, rss_entry, config):
+def extract_audio_url(meta, page_html, rss_entry, config, parsed):
     """Extract audio URL with quality preference."""
     quality_order = get_quality_preference_order(config['preferred_quality'])
     
-    if rss_entry.get('enclosures'):
-        enclosure_urls = []
-        for enclosure in rss_entry.enclosures:
-            url = enclosure.get('url', '')
-            if url and ('mp3' in url.lower() or 'm4a' in url.lower()):
-                enclosure_urls.append(url)
-        
-        for quality in quality_order:
-            for url in enclosure_urls:
-                if quality in url.lower():
-                    logger.debug(f"Selected enclosure URL with quality {quality}: {url}")
-                    return url
-        if enclosure_urls:
-            logger.debug(f"No preferred quality found, using first enclosure: {enclosure_urls[0]}")
-            return enclosure_urls[0]
-    
-    og_audio = soup.find('meta', attrs={'property': 'og:audio'})
-    if og_audio:
-        logger.debug(f"Using og:audio URL: {og_audio.get('content')}")
-        return og_audio.get('content')
-    
-    audio_tag = soup.find('audio')
-    if audio_tag and audio_tag.get('src'):
-        logger.debug(f"Using audio tag URL: {audio_tag['src']}")
-        return audio_tag['src']
-    
-    scripts = soup.find_all('script')
-    for script in scripts:
-        if not script.string:
+    enclosure_url = select_enclosure_url(rss_entry, quality_order)
+    if enclosure_url:
+        return enclosure_url
+    
+    if ('property', 'og:audio') in meta:
+        og_audio = meta[('property', 'og:audio')]
+        logger.debug(f"Using og:audio URL: {og_audio}")
+        return og_audio
+    
+    elements = find_elements(page_html, parsed)
+    if elements['audio'] and elements['audio'][0][0].get('src'):
+        audio_src = elements['audio'][0][0]['src']
+        logger.debug(f"Using audio tag URL: {audio_src}")
+        return audio_src
+    
+    for _, script in elements['script']:
+        if not script:
             continue
-        if 'STATE_FROM_SERVER' in script.string:
+        if 'STATE_FROM_SERVER' in script:
             for quality in quality_order:
-                pattern = rf'"url":"https://dl\.iono\.fm/epi/prov_\d+/epi_\d+_{quality}\.m4a"'
-                match = re.search(pattern, script.string)
+                match = _QUALITY_RE[quality][0].search(script)
                 if match:
                     url = match.group(0).replace('\\"', '"').replace('\\/', '/')
-                    url = re.search(r'https://dl\.iono\.fm/epi/prov_\d+/epi_\d+_\w+\.m4a', url).group(0)
+                    url = _AUDIO_URL_RE.search(url).group(0)
                     logger.debug(f"Found script URL with quality {quality}: {url}")
                     return url
         
-        if 'dl.iono.fm' in script.string:
+        if 'dl.iono.fm' in script:
             for quality in quality_order:
-                pattern = rf'https://dl\.iono\.fm/epi/prov_\d+/epi_\d+_{quality}\.m4a'
-                match = re.search(pattern, script.string)
+                match = _QUALITY_RE[quality][1].search(script)
                 if match:
                     logger.debug(f"Found script URL with quality {quality}: {match.group(0)}")
                     return match.group(0)
     
-    text = str(soup)
-    match = re.search(r'https://dl\.iono\.fm/epi/prov_\d+/epi_\d+_\w+\.m4a', text)
+    match = _AUDIO_URL_RE.search(page_html)
     if match:
         logger.debug(f"Found fallback URL in page text: {match.group(0)}")
         return match.group(0)
@@ -304,7 +499,7 @@ def extract_audio_url(soup, rss_entry, config):
 def get_audio_url_and_metadata(episode_page_url, rss_ep_num, rss_title, rss_entry, config):
     """Fetch episode page and extract audio URL and metadata."""
     try:
-        response = requests.get(episode_page_url, timeout=config['timeout'])
+        response = SESSION.get(episode_page_url, timeout=config['timeout'])
         response.raise_for_status()
     except requests.RequestException as e:
         logger.warning(f"Failed to fetch {episode_page_url}: {e}")
@@ -319,10 +514,12 @@ def get_audio_url_and_metadata(episode_page_url, rss_ep_num, rss_title, rss_entr
                     break
         return enclosure_url, rss_ep_num, rss_title, rss_title, None
 
-    soup = BeautifulSoup(response.text, 'html.parser')
-    audio_url = extract_audio_url(soup, rss_entry, config)
-    html_ep_num, description, og_title = extract_episode_metadata(soup, rss_ep_num, rss_title)
-    author = extract_author(soup)
+    page_html = response.text
+    parsed = {}  # Filled by the first full parse, if any, and shared by both extractors
+    meta = extract_meta_tags(page_html, parsed)
+    audio_url = extract_audio_url(meta, page_html, rss_entry, config, parsed)
+    html_ep_num, description, og_title = extract_episode_metadata(meta, page_html, rss_ep_num, rss_title)
+    author = extract_author(meta)
     
     if not audio_url and rss_entry.get('enclosures'):
         for enclosure in rss_entry.enclosures:
@@ -339,10 +536,12 @@ def get_audio_url_and_metadata(episode_page_url, rss_ep_num, rss_title, rss_entr
 
 def compute_file_hash(filepath):
     """Compute SHA256 hash of a file."""
-    sha256 = hashlib.sha256()
     try:
         with open(filepath, 'rb') as f:
-            for chunk in iter(lambda: f.read(8192), b''):
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, 'sha256').hexdigest()
+            sha256 = hashlib.sha256()
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
                 sha256.update(chunk)
         return sha256.hexdigest()
     except IOError as e:
@@ -350,7 +549,7 @@ def compute_file_hash(filepath):
         return None
 
 @retry_on_failure(max_retries=3, delay=1, backoff=2)
-def check_file_completeness(url, filepath, rss_enclosure_length=None):
+def check_file_completeness(url, filepath, rss_enclosure_length=None, verify_hash=False):
     """Check if a file exists and is complete, trying both .mp3 and .m4a if needed."""
     possible_extensions = ['.mp3', '.m4a']
     base_filepath = filepath.rsplit('.', 1)[0]  # Remove extension
@@ -375,13 +574,16 @@ def check_file_completeness(url, filepath, rss_enclosure_length=None):
         return False, None, "Redownloading empty file"
     
     try:
-        response = requests.head(url, allow_redirects=True, timeout=10)
+        response = SESSION.head(url, allow_redirects=True, timeout=10)
         response.raise_for_status()
         
         source_size = int(response.headers.get('Content-Length', 0))
         server_hash = response.headers.get('ETag', '').strip('"')
 
-        if server_hash:
+        if source_size > 0 and local_size != source_size:
+            return False, local_size, f"Redownloading incomplete file (size mismatch): {os.path.basename(existing_filepath)} (local: {local_size:,} bytes, expected: {source_size:,} bytes)"
+        
+        if verify_hash and server_hash:
             local_hash = compute_file_hash(existing_filepath)
             if local_hash and local_hash == server_hash:
                 return True, local_size, f"Skipping complete file (hash match): {os.path.basename(existing_filepath)} ({local_size:,} bytes)"
@@ -389,10 +591,7 @@ def check_file_completeness(url, filepath, rss_enclosure_length=None):
                 return False, local_size, f"Redownloading incomplete file (hash mismatch): {os.path.basename(existing_filepath)} (local: {local_size:,} bytes, expected: {source_size:,} bytes)"
         
         elif source_size > 0:
-            if local_size == source_size:
-                return True, local_size, f"Skipping complete file: {os.path.basename(existing_filepath)} ({local_size:,} bytes)"
-            else:
-                return False, local_size, f"Redownloading incomplete file (size mismatch): {os.path.basename(existing_filepath)} (local: {local_size:,} bytes, expected: {source_size:,} bytes)"
+            return True, local_size, f"Skipping complete file: {os.path.basename(existing_filepath)} ({local_size:,} bytes)"
         
         elif rss_enclosure_length and rss_enclosure_length > 0:
             if local_size == rss_enclosure_length:
@@ -408,6 +607,44 @@ def check_file_completeness(url, filepath, rss_enclosure_length=None):
         logger.debug(f"Could not check source for {url}: {e}")
         return False, local_size, f"Cannot verify completeness (network error): {os.path.basename(existing_filepath)} (local: {local_size:,} bytes)"
 
+class ProgressWriter:
+    """File wrapper that reports each write to a callback and stops once CANCEL_EVENT is set."""
+    
+    def __init__(self, f, on_write, url):
+        self.f = f
+        self.on_write = on_write
+        self.url = url
+    
+    def write(self, data):
+        if CANCEL_EVENT.is_set():
+            raise DownloadCancelled(self.url)
+        written = self.f.write(data)
+        self.on_write(len(data))
+        return written
+
+def copy_response_to_file(response, f, on_write, url):
+    """Copy a streamed response body to f in CHUNK_SIZE blocks via shutil.copyfileobj."""
+    response.raw.decode_content = True
+    try:
+        shutil.copyfileobj(response.raw, ProgressWriter(f, on_write, url), CHUNK_SIZE)
+    except urllib3.exceptions.HTTPError as e:
+        # Surface mid-stream failures as requests errors so retry_on_failure resumes the download
+        raise requests.exceptions.ConnectionError(e) from e
+
+def advise_file(f, advice_name, sync=False):
+    """Give the kernel a posix_fadvise hint for an open file, where supported."""
+    advice = getattr(os, advice_name, None)
+    if advice is None or not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        f.flush()
+        if sync:
+            # DONTNEED only drops clean pages, so write the data back first
+            getattr(os, 'fdatasync', os.fsync)(f.fileno())
+        os.posix_fadvise(f.fileno(), 0, 0, advice)
+    except OSError as e:
+        logger.debug(f"posix_fadvise({advice_name}) failed for {f.name}: {e}")
+
 @retry_on_failure(max_retries=3, delay=1, backoff=2)
 def download_file_with_resume(url, filepath, config):
     """Download with resume capability."""
@@ -422,42 +659,45 @@ def download_file_with_resume(url, filepath, config):
             logger.info(f"Resuming download from byte {initial_pos:,}")
     
     try:
-        response = requests.get(url, headers=headers, stream=True, timeout=config['timeout'])
-        if response.status_code == 416:
-            logger.info(f"File appears complete: {os.path.basename(filepath)}")
-            return
-        
-        response.raise_for_status()
-        
-        content_length = response.headers.get('Content-Length')
-        total_size = int(content_length) + initial_pos if content_length else None
-        
-        mode = 'ab' if initial_pos > 0 else 'wb'
-        
-        with open(filepath, mode) as f:
-            if tqdm and total_size:
-                with tqdm(
-                    total=total_size, 
-                    initial=initial_pos, 
-                    unit='B', 
-                    unit_scale=True,
-                    desc=os.path.basename(filepath)
-                ) as pbar:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                            pbar.update(len(chunk))
-            else:
-                bytes_downloaded = initial_pos
-                last_reported = initial_pos
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        bytes_downloaded += len(chunk)
+        with SESSION.get(url, headers=headers, stream=True, timeout=config['timeout']) as response:
+            if response.status_code == 416:
+                logger.info(f"File appears complete: {os.path.basename(filepath)}")
+                return
+            
+            response.raise_for_status()
+            
+            content_length = response.headers.get('Content-Length')
+            total_size = int(content_length) + initial_pos if content_length else None
+            
+            mode = 'ab' if initial_pos > 0 else 'wb'
+            
+            with open(filepath, mode) as f:
+                advise_file(f, 'POSIX_FADV_SEQUENTIAL')
+                if tqdm and total_size:
+                    with tqdm(
+                        total=total_size, 
+                        initial=initial_pos, 
+                        unit='B', 
+                        unit_scale=True,
+                        desc=os.path.basename(filepath)
+                    ) as pbar:
+                        copy_response_to_file(response, f, pbar.update, url)
+                else:
+                    bytes_downloaded = initial_pos
+                    last_reported = initial_pos
+                    
+                    def report_progress(size):
+                        nonlocal bytes_downloaded, last_reported
+                        bytes_downloaded += size
                         if total_size and (bytes_downloaded - last_reported >= progress_interval or bytes_downloaded == total_size):
                             percent = (bytes_downloaded / total_size) * 100
                             logger.info(f"Progress for {os.path.basename(filepath)}: {percent:.1f}% ({bytes_downloaded:,}/{total_size:,} bytes)")
                             last_reported = bytes_downloaded
+                    
+                    copy_response_to_file(response, f, report_progress, url)
+                
+                # Finished episodes are rarely reread; let the kernel drop them from the page cache
+                advise_file(f, 'POSIX_FADV_DONTNEED', sync=True)
         
         final_size = os.path.getsize(filepath)
         logger.info(f"Downloaded: {os.path.basename(filepath)} ({final_size:,} bytes)")
@@ -466,9 +706,30 @@ def download_file_with_resume(url, filepath, config):
         logger.error(f"Download failed for {url}: {e}")
         raise
 
+def fetch_metadata_concurrently(pending, config):
+    """Fetch episode page metadata in parallel, yielding results in feed order."""
+    if not pending:
+        return
+    
+    with ThreadPoolExecutor(max_workers=config['max_concurrent_fetches']) as executor:
+        futures = [
+            executor.submit(get_audio_url_and_metadata, ep_url, rss_ep_num, title, entry, config)
+            for rss_ep_num, title, ep_url, episode_id, pub_date, enclosure_length, entry in pending
+        ]
+        try:
+            for episode, future in zip(pending, futures):
+                try:
+                    yield episode, future.result()
+                except Exception as e:
+                    logger.error(f"Failed to fetch metadata for {episode[1]}: {e}")
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
 def download_file(url, filepath, rss_enclosure_length=None, recheck=False, config=None):
     """Download a file if it doesn't exist or is incomplete."""
-    is_complete, local_size, message = check_file_completeness(url, filepath, rss_enclosure_length)
+    is_complete, local_size, message = check_file_completeness(url, filepath, rss_enclosure_length, config.get('verify_hash', False))
     
     if is_complete and not recheck:
         logger.info(message)
@@ -477,6 +738,183 @@ def download_file(url, filepath, rss_enclosure_length=None, recheck=False, confi
     logger.info(message)
     download_file_with_resume(url, filepath, config)
 
+def download_episode(episode, download_dir, args, config):
+    """Resolve the filename for a processed episode and download it."""
+    html_ep_num, title, ep_url, audio_url, description, episode_id, pub_date, enclosure_length, og_title, pub_parsed = episode
+    try:
+        ext = resolve_extension(audio_url, SESSION, config)
+        name_source = og_title if args.short_names or (description and len(description) > config['filename_max_length']) else description
+        filename = f"{sanitize_filename(name_source, config['filename_max_length'])}_{episode_id}{ext}"
+        filepath = os.path.join(download_dir, filename)
+        
+        if not os.path.exists(filepath):
+            logger.info(f"Cache miss for {ep_url}; downloading new file")
+        download_file(audio_url, filepath, enclosure_length, args.recheck, config)
+        logger.info(f"Saved: {filename}")
+        return True
+        
+    except DownloadCancelled:
+        logger.debug(f"Download cancelled: {title}")
+        return False
+    except Exception as e:
+        logger.error(f"Failed to download {title}: {e}")
+        return False
+
+def bootstrap_download_dir(first_episode, podcast_name, config, args):
+    """Resolve the download directory from the first episode, returning its cache and metadata."""
+    rss_ep_num, title, ep_url, episode_id, pub_date, enclosure_length, enclosure_url, entry = first_episode
+    first_metadata = None
+    # The page is only needed to name the directory after its author
+    if not args.dir:
+        first_metadata = get_audio_url_and_metadata(ep_url, rss_ep_num, title, entry, config)
+    author = first_metadata[4] if first_metadata else None
+    download_dir = sanitize_filename(args.dir or author or podcast_name, config['filename_max_length'])
+    os.makedirs(download_dir, exist_ok=True)
+    cache = load_episode_cache(os.path.join(download_dir, 'cache.json'))
+    return download_dir, cache, first_metadata
+
+def rss_item_to_entry(item):
+    """Convert an RSS <item> element into a feedparser-style entry."""
+    guid = (item.findtext('guid') or '').strip()
+    entry = feedparser.FeedParserDict(
+        title=(item.findtext('title') or '').strip(),
+        link=(item.findtext('link') or '').strip() or guid,
+        id=guid,
+        links=[
+            feedparser.FeedParserDict(rel='enclosure', href=enclosure.get('url', ''),
+                                      length=enclosure.get('length', ''), type=enclosure.get('type', ''))
+            for enclosure in item.findall('enclosure')
+        ]
+    )
+    
+    pub_date = (item.findtext('pubDate') or '').strip()
+    if pub_date:
+        entry['published'] = pub_date
+        parsed = email.utils.parsedate_tz(pub_date)
+        if parsed:
+            entry['published_parsed'] = time.gmtime(email.utils.mktime_tz(parsed))
+    
+    summary = item.findtext('description') or item.findtext(f'{ITUNES_NS}summary')
+    if summary:
+        entry['summary'] = summary.strip()
+    author = item.findtext('author') or item.findtext(f'{ITUNES_NS}author')
+    if author:
+        entry['author'] = author.strip()
+    return entry
+
+def parse_rss_fast(content):
+    """Stream-parse an RSS 2.0 document with ElementTree into a feedparser-style result."""
+    root = None
+    entries = []
+    for event, elem in ET.iterparse(io.BytesIO(content), events=('start', 'end')):
+        if root is None:
+            root = elem
+            if root.tag != 'rss':
+                raise ValueError(f"not an RSS 2.0 document (root element <{root.tag}>)")
+        elif event == 'end' and elem.tag == 'item':
+            entries.append(rss_item_to_entry(elem))
+            elem.clear()
+    
+    channel = root.find('channel')
+    title = channel.findtext('title') if channel is not None else None
+    return feedparser.FeedParserDict(
+        feed=feedparser.FeedParserDict(title=(title or '').strip()),
+        entries=entries,
+        bozo=0
+    )
+
+def parse_feed(content, response_headers):
+    """Parse feed bytes with the ElementTree fast path, falling back to feedparser."""
+    try:
+        feed = parse_rss_fast(content)
+        if feed.feed.get('title'):
+            return feed
+        logger.debug("Fast RSS parse found no channel title. Falling back to feedparser.")
+    except (ET.ParseError, ValueError) as e:
+        logger.debug(f"Fast RSS parse failed ({e}). Falling back to feedparser.")
+    return feedparser.parse(content, response_headers=response_headers)
+
+def fetch_feed(rss_urls, feed_meta, config):
+    """Fetch the first usable RSS feed over the shared session, using cached validators for a conditional GET."""
+    feed = None
+    for rss_url in rss_urls:
+        logger.info(f"Fetching RSS feed from {rss_url}...")
+        headers = {}
+        if feed_meta.get('rss_url') == rss_url:
+            if feed_meta.get('etag'):
+                headers['If-None-Match'] = feed_meta['etag']
+            if feed_meta.get('modified'):
+                headers['If-Modified-Since'] = feed_meta['modified']
+        try:
+            response = SESSION.get(rss_url, headers=headers, timeout=config['timeout'])
+            if response.status_code == 304:
+                return feedparser.FeedParserDict(status=304, feed={}, entries=[]), rss_url
+            response.raise_for_status()
+            
+            feed = parse_feed(response.content, dict(response.headers))
+            feed['status'] = response.status_code
+            feed['etag'] = response.headers.get('ETag')
+            feed['modified'] = response.headers.get('Last-Modified')
+            if feed.feed.get('title'):
+                return feed, rss_url
+            logger.warning(f"No podcast name found in {rss_url}. Trying next feed...")
+        except Exception as e:
+            logger.error(f"Failed to parse {rss_url}: {e}")
+    return feed, None
+
+def load_feed_cache():
+    """Load per-channel RSS validators (ETag/Last-Modified) from feed_cache.json."""
+    if os.path.exists(FEED_CACHE_FILE):
+        try:
+            with open(FEED_CACHE_FILE, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError):
+            logger.warning("Corrupted or inaccessible feed cache file. Starting fresh.")
+    return {}
+
+def write_json_atomic(path, data):
+    """Write JSON to a temporary file and atomically replace the target."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+def save_feed_cache(feed_cache):
+    """Save per-channel RSS validators to feed_cache.json."""
+    try:
+        write_json_atomic(FEED_CACHE_FILE, feed_cache)
+    except IOError as e:
+        logger.warning(f"Could not save feed cache: {e}")
+
+def load_episode_cache(cache_file):
+    """Load the episode metadata cache for a download directory."""
+    if os.path.exists(cache_file):
+        try:
+            with open(cache_file, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError):
+            logger.warning("Corrupted or inaccessible cache file. Starting fresh.")
+    return {}
+
+def save_episode_cache(cache_file, cache):
+    """Save the episode metadata cache for a download directory."""
+    try:
+        write_json_atomic(cache_file, cache)
+    except IOError as e:
+        logger.warning(f"Could not save cache: {e}")
+
+def episode_from_cache(ep_url, data):
+    """Build a processed episode tuple from a cache entry, or None if it is incomplete."""
+    required_keys = ['html_ep_num', 'audio_url', 'description']
+    if not all(key in data for key in required_keys):
+        return None
+    return (
+        data['html_ep_num'], data['title'], ep_url, data['audio_url'],
+        data['description'], data.get('episode_id') or ep_url.split('/')[-1], data.get('pub_date', ''),
+        data.get('enclosure_length'), data.get('og_title') or data['title'],
+        publication_time_tuple(data.get('pub_parsed'), data.get('pub_date', ''))
+    )
+
 def main():
     """Main function to download podcast series from iono.fm."""
     config = load_config()
@@ -486,7 +924,10 @@ def main():
     global logger
     logger = setup_logging(config['log_level'])
     
-    install_missing_modules()
+    prime_dns()
+    
+    if not args.no_install_check:
+        install_missing_modules()
     
     channel_id = args.channel_url.split('/')[-1]
     rss_urls = [
@@ -494,30 +935,48 @@ def main():
         f'https://iono.fm/rss/prov/{channel_id}'
     ]
 
-    feed = None
-    for rss_url in rss_urls:
-        logger.info(f"Fetching RSS feed from {rss_url}...")
-        try:
-            feed = feedparser.parse(rss_url)
-            if feed.feed.get('title'):
-                break
-            logger.warning(f"No podcast name found in {rss_url}. Trying next feed...")
-        except Exception as e:
-            logger.error(f"Failed to parse {rss_url}: {e}")
+    feed_cache = load_feed_cache()
+    feed_meta = {} if args.recheck else feed_cache.get(channel_id, {})
+    if feed_meta.get('dir') != args.dir:
+        # The cached download directory only applies to runs with the same --dir
+        feed_meta = {}
+    feed, rss_url = fetch_feed(rss_urls, feed_meta, config)
+
+    download_dir = None
+    cache_file = None
+    cache = {}
+    cache_dirty = False
+    cached_episodes = []
+    
+    not_modified = feed is not None and feed.get('status') == 304
+    if not_modified:
+        download_dir = feed_meta.get('download_dir')
+        if download_dir:
+            cache_file = os.path.join(download_dir, 'cache.json')
+            cache = load_episode_cache(cache_file)
+        cached_episodes = [
+            episode_from_cache(ep_url, cache[ep_url]) if ep_url in cache else None
+            for ep_url in feed_meta.get('episodes', [])
+        ]
+        if not cached_episodes or None in cached_episodes:
+            logger.info("Cached episodes incomplete for unchanged feed. Refetching full RSS feed...")
+            not_modified = False
+            download_dir = None
+            feed, rss_url = fetch_feed(rss_urls, {}, config)
     
-    if not feed or not feed.feed.get('title'):
+    if not not_modified and (not feed or not feed.feed.get('title')):
         logger.error(f"Could not retrieve podcast name from RSS feeds. Check the channel URL.")
         sys.exit(2)
 
-    podcast_name = feed.feed.title
+    if not_modified:
+        podcast_name = feed_meta.get('podcast_name', download_dir)
+        logger.info(f"RSS feed not modified since last run. Using {len(cached_episodes)} cached episodes.")
+    else:
+        podcast_name = feed.feed.title
     logger.info(f"Podcast/Series: {podcast_name}")
 
-    download_dir = None
-    cache_file = None
-    cache = {}
-
     episodes = []
-    for entry in feed.entries:
+    for entry in ([] if not_modified else feed.entries):
         title = entry.title
         rss_ep_num = extract_episode_number(title)
         link = entry.link
@@ -534,34 +993,23 @@ def main():
                     break
         episodes.append((rss_ep_num, title, link, episode_id, pub_date, enclosure_length, enclosure_url, entry))
     
-    logger.info(f"Found {len(episodes)} episodes for {podcast_name}")
+    if not not_modified:
+        logger.info(f"Found {len(episodes)} episodes for {podcast_name}")
 
     try:
-        processed_episodes = []
-        for rss_ep_num, title, ep_url, episode_id, pub_date, enclosure_length, enclosure_url, entry in episodes:
-            if download_dir is None:
-                audio_url, html_ep_num, description, og_title, author = get_audio_url_and_metadata(ep_url, rss_ep_num, title, entry, config)
-                download_dir = sanitize_filename(args.dir or author or podcast_name, config['filename_max_length'])
-                cache_file = os.path.join(download_dir, 'cache.json')
-                os.makedirs(download_dir, exist_ok=True)
-                
-                if os.path.exists(cache_file):
-                    try:
-                        with open(cache_file, 'r') as f:
-                            cache = json.load(f)
-                    except (json.JSONDecodeError, IOError):
-                        logger.warning("Corrupted or inaccessible cache file. Starting fresh.")
-                        cache = {}
+        processed_episodes = cached_episodes if not_modified else []
+        pending = []
+        prefetched = []
+        first_metadata = None
+        if download_dir is None and episodes:
+            download_dir, cache, first_metadata = bootstrap_download_dir(episodes[0], podcast_name, config, args)
+            cache_file = os.path.join(download_dir, 'cache.json')
 
+        for rss_ep_num, title, ep_url, episode_id, pub_date, enclosure_length, enclosure_url, entry in episodes:
             if ep_url in cache and not args.recheck:
-                data = cache.get(ep_url, {})
-                required_keys = ['html_ep_num', 'audio_url', 'description']
-                if all(key in data for key in required_keys):
-                    processed_episodes.append((
-                        data['html_ep_num'], data['title'], ep_url, data['audio_url'],
-                        data['description'], episode_id, data.get('pub_date', ''),
-                        data.get('enclosure_length')
-                    ))
+                cached_episode = episode_from_cache(ep_url, cache[ep_url])
+                if cached_episode:
+                    processed_episodes.append(cached_episode)
                     logger.debug(f"Using cached episode data: {title}")
                     continue
             
@@ -571,11 +1019,36 @@ def main():
             if enclosure_url:
                 logger.debug(f"RSS enclosure: {enclosure_url}")
             
-            audio_url, html_ep_num, description, og_title, _ = get_audio_url_and_metadata(ep_url, rss_ep_num, title, entry, config)
+            episode = (rss_ep_num, title, ep_url, episode_id, pub_date, enclosure_length, entry)
+            if first_metadata and ep_url == episodes[0][2]:
+                prefetched.append((episode, first_metadata))
+                continue
+            # Episodes cached from page metadata keep that source so their filenames stay stable
+            rss_metadata = get_rss_metadata(entry, rss_ep_num, config) if config['prefer_rss_metadata'] and ep_url not in cache else None
+            if rss_metadata:
+                logger.debug(f"Using RSS metadata (skipping page fetch): {title}")
+                prefetched.append((episode, rss_metadata))
+            else:
+                pending.append(episode)
+
+        fetched = itertools.chain(prefetched, fetch_metadata_concurrently(pending, config))
+        for (rss_ep_num, title, ep_url, episode_id, pub_date, enclosure_length, entry), metadata in fetched:
+            audio_url, html_ep_num, description, og_title, _ = metadata
+            pub_parsed = entry.get('published_parsed')
             if not audio_url:
                 logger.error(f"Skipping episode (no audio URL): {title}")
                 continue
             
+            previous = cache.get(ep_url)
+            if previous:
+                # Keep the names existing files were saved under when rechecking
+                html_ep_num = previous.get('html_ep_num', html_ep_num)
+                description = previous.get('description') or description
+                og_title = previous.get('og_title') or og_title
+            elif config['prefer_rss_metadata']:
+                # Name every new episode from RSS, even when its page was fetched for the audio URL or author
+                html_ep_num, description, og_title = rss_episode_names(entry, rss_ep_num)
+            
             cache[ep_url] = {
                 'html_ep_num': html_ep_num,
                 'title': title,
@@ -583,20 +1056,37 @@ def main():
                 'description': description,
                 'episode_id': episode_id,
                 'pub_date': pub_date,
-                'enclosure_length': enclosure_length
+                'enclosure_length': enclosure_length,
+                'og_title': og_title,
+                'pub_parsed': list(pub_parsed) if pub_parsed else None
             }
-            
-            try:
-                with open(cache_file, 'w') as f:
-                    json.dump(cache, f, indent=2)
-            except IOError as e:
-                logger.warning(f"Could not save cache: {e}")
-            
-            processed_episodes.append((html_ep_num, title, ep_url, audio_url, description, episode_id, pub_date, enclosure_length))
+            cache_dirty = True
+            processed_episodes.append((html_ep_num, title, ep_url, audio_url, description, episode_id, pub_date, enclosure_length, og_title, publication_time_tuple(pub_parsed, pub_date)))
+
+        if cache_dirty:
+            save_episode_cache(cache_file, cache)
+            cache_dirty = False
+
+        if not not_modified:
+            # Only trust a future 304 if every episode in this feed made it into the cache
+            feed_urls = [episode[2] for episode in episodes]
+            if (feed.get('etag') or feed.get('modified')) and all(ep_url in cache for ep_url in feed_urls):
+                feed_cache[channel_id] = {
+                    'rss_url': rss_url,
+                    'etag': feed.get('etag'),
+                    'modified': feed.get('modified'),
+                    'podcast_name': podcast_name,
+                    'download_dir': download_dir,
+                    'dir': args.dir,
+                    'episodes': feed_urls
+                }
+                save_feed_cache(feed_cache)
+            elif feed_cache.pop(channel_id, None) is not None:
+                save_feed_cache(feed_cache)
 
         processed_episodes.sort(key=lambda x: (
             x[0] if x[0] is not None else float('inf'),
-            parse_publication_date(x[6]),
+            x[9],
             x[5]
         ))
         logger.info(f"Sorted {len(processed_episodes)} episodes")
@@ -611,34 +1101,26 @@ def main():
                 logger.info("Download cancelled")
                 sys.exit(3)
 
-        success_count = 0
-        for html_ep_num, title, ep_url, audio_url, description, episode_id, pub_date, enclosure_length in processed_episodes:
+        # Route console log lines through tqdm so they don't garble the concurrent progress bars
+        console_redirect = logging_redirect_tqdm(loggers=[logger]) if logging_redirect_tqdm else contextlib.nullcontext()
+        with console_redirect, ThreadPoolExecutor(max_workers=config['max_concurrent_downloads']) as executor:
+            futures = [
+                executor.submit(download_episode, episode, download_dir, args, config)
+                for episode in processed_episodes
+            ]
             try:
-                content_type = None
-                try:
-                    head_response = requests.head(audio_url, allow_redirects=True, timeout=config['timeout'])
-                    content_type = head_response.headers.get('Content-Type', '')
-                except requests.RequestException:
-                    logger.debug(f"Could not fetch Content-Type for {audio_url}")
-                
-                ext = get_file_extension(audio_url, content_type, config['preferred_format'])
-                name_source = og_title if args.short_names or (description and len(description) > config['filename_max_length']) else description
-                filename = f"{sanitize_filename(name_source, config['filename_max_length'])}_{episode_id}{ext}"
-                filepath = os.path.join(download_dir, filename)
-                
-                if not os.path.exists(filepath):
-                    logger.info(f"Cache miss for {ep_url}; downloading new file")
-                download_file(audio_url, filepath, enclosure_length, args.recheck, config)
-                logger.info(f"Saved: {filename}")
-                success_count += 1
-                
-            except Exception as e:
-                logger.error(f"Failed to download {title}: {e}")
-                continue
+                success_count = sum(1 for future in as_completed(futures) if future.result())
+            except KeyboardInterrupt:
+                CANCEL_EVENT.set()
+                for future in futures:
+                    future.cancel()
+                raise
 
         logger.info(f"Successfully downloaded {success_count}/{len(processed_episodes)} episodes")
 
     except KeyboardInterrupt:
+        if cache_dirty:
+            save_episode_cache(cache_file, cache)
         logger.info(f"Download interrupted. Partial downloads may be in '{download_dir}'")
         sys.exit(4)
 
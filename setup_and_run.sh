@@ -16,7 +16,7 @@ trap 'handle_error $LINENO $?' ERR
 
 # Show usage
 show_usage() {
-    echo "Usage: $0 https://iono.fm/c/<number> [--force] [--short-names] [--dir <name>] [--recheck] [--log-level <DEBUG|INFO|WARNING|ERROR>] [--venv-dir <path>]"
+    echo "Usage: $0 https://iono.fm/c/<number> [--force] [--short-names] [--dir <name>] [--recheck] [--no-install-check] [--log-level <DEBUG|INFO|WARNING|ERROR>] [--venv-dir <path>]"
     exit 1
 }
 
@@ -77,7 +77,7 @@ parse_arguments() {
             https://iono.fm/c/[0-9]*)
                 CHANNEL_URL="$1"
                 ;;
-            --force|--short-names|--recheck)
+            --force|--short-names|--recheck|--no-install-check)
                 ADDITIONAL_ARGS+=("$1")
                 ;;
             --dir|--log-level|--venv-dir)
@@ -127,8 +127,8 @@ fi
 source "$VENV_DIR/bin/activate"
 
 echo "Installing required Python packages..."
-if ! pip3 install requests beautifulsoup4 feedparser tqdm python-dateutil; then
-    echo "Failed to install Python packages. Run 'pip3 install requests beautifulsoup4 feedparser tqdm python-dateutil' in the virtual environment."
+if ! pip3 install requests beautifulsoup4 feedparser tqdm python-dateutil lxml selectolax; then
+    echo "Failed to install Python packages. Run 'pip3 install requests beautifulsoup4 feedparser tqdm python-dateutil lxml selectolax' in the virtual environment."
     deactivate
     exit 1
 fi